@@ -145,7 +145,7 @@ def filter(
 
     # Output slices filtered by capture site
     for capture_site, df_cap in slice_filter.slices.query('capture != "."').groupby(
-        "capture"
+        "capture", observed=True
     ):
 
         # Extract only fragments that appear in the capture dataframe
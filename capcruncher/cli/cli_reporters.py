@@ -16,6 +16,7 @@ def cli():
 @click.option('--threshold_count', help='Minimum count required to be considered for analysis', default=20, type=click.FLOAT)
 @click.option('--threshold_q', help='Upper threshold of q-value required for output.', default=0.05, type=click.FLOAT)
 @click.option('--threshold_mean', help='Minimum mean count required for output.', default=0, type=click.FLOAT)
+@click.option('-p', '--n_cores', help='Number of cores to use for writing pairwise comparisons', default=1, type=click.INT)
 def differential(*args, **kwargs):
     """
     Identifies differential interactions between conditions.
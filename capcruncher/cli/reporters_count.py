@@ -72,8 +72,22 @@ def count(
         writer.write(header.encode())
 
         # Open reporter tsv file as a chunked reader (these files can get very large)
+        # Only the columns required for counting are parsed to reduce memory usage.
         chunksize = 2e6
-        df_reporters_iterator = pd.read_csv(reporters, sep="\t", chunksize=chunksize)
+        df_reporters_iterator = pd.read_csv(
+            reporters,
+            sep="\t",
+            chunksize=chunksize,
+            usecols=[
+                "slice_name",
+                "parent_read",
+                "restriction_fragment",
+                "capture",
+                "exclusion",
+                "exclusion_count",
+            ],
+            dtype={"exclusion_count": "int32"},
+        )
 
         ligated_rf_counts = defaultdict(int)
         for ii, df_reporters in enumerate(df_reporters_iterator):
@@ -2,14 +2,63 @@ import os
 import pandas as pd
 import itertools
 import numpy as np
+from joblib import Parallel, delayed
 
 
-def get_chromosome_from_name(df: pd.DataFrame, name: str):
-    chrom = (df.query(f'name == "{name}"')
-               ['chrom']
-               .iloc[0])
-    return chrom
-    
+def write_comparison(df_comparison: pd.DataFrame,
+                     df_coords: pd.DataFrame,
+                     output: os.PathLike):
+    """
+    Adds fragment coordinates to a pairwise comparison and writes it to a tsv.
+
+    Args:
+        df_comparison (pd.DataFrame): Summary of a pairwise test. 'gene' column contains fragment positions.
+        df_coords (pd.DataFrame): Coordinates (chrom, start, end) of all union bedgraph fragments.
+        output (os.PathLike): Output tsv path.
+    """
+
+    columns = ['chrom', 'start', 'end', 'mean', 'log2fc', 'pval', 'qval']
+
+    # Gather the fragment coords by position and combine with the test results
+    positions = df_comparison['gene'].values.astype(int)
+    df_output = pd.DataFrame({**{col: df_coords[col].values.take(positions) for col in columns[:3]},
+                              **{col: df_comparison[col].values for col in columns[3:]}})
+
+    # Output to tsv
+    df_output.to_csv(output, sep='\t', index=False)
+
+
+def filter_counts_by_threshold(df_counts: pd.DataFrame,
+                               groups: pd.Series,
+                               threshold_count: float = 20) -> pd.DataFrame:
+    """
+    Removes fragments without enough interactions in at least two replicates of a group.
+
+    Group membership is encoded as an indicator matrix (N_SAMPLES * N_GROUPS) so that
+    the number of passing replicates per group can be obtained with a single matrix product.
+    Fragments failing the threshold in a group have the counts for that group set to zero.
+
+    Args:
+        df_counts (pd.DataFrame): Reporter counts (N_FRAGMENTS * N_SAMPLES).
+        groups (pd.Series): Group of each sample, in the same order as the df_counts columns.
+        threshold_count (float, optional): Minimum number of reported interactions required. Defaults to 20.
+
+    Returns:
+        pd.DataFrame: Counts for fragments passing the threshold in at least one group.
+    """
+
+    counts = df_counts.to_numpy(copy=False)
+    indicator = pd.get_dummies(groups).to_numpy(dtype=np.int16)
+    n_replicates_passing = (counts >= threshold_count) @ indicator
+    group_passes = n_replicates_passing >= 2
+    sample_passes = (group_passes @ indicator.T).astype(bool)
+
+    fragment_passes = group_passes.any(axis=1)
+
+    return pd.DataFrame(np.where(sample_passes, counts, 0)[fragment_passes],
+                        index=df_counts.index[fragment_passes],
+                        columns=df_counts.columns)
+
 
 def differential(union_bedgraph: os.PathLike,
                               capture_name: str,
@@ -19,7 +68,8 @@ def differential(union_bedgraph: os.PathLike,
                               grouping_col: str = 'condition',
                               threshold_count: float = 20,
                               threshold_q: float = 0.05,
-                              threshold_mean: float = 0):
+                              threshold_mean: float = 0,
+                              n_cores: int = 1):
     
     """
     Identifies differential interactions between conditions.
@@ -52,11 +102,13 @@ def differential(union_bedgraph: os.PathLike,
         threshold_count (float, optional): Minimum number of reported interactions required. Defaults to 20.
         threshold_q (float, optional): Maximum q-value for output. Defaults to 0.05.
         threshold_mean (float, optional): Minimum mean value for output. Defaults to 0.
+        n_cores (int, optional): Number of cores to use for writing pairwise comparisons. Defaults to 1.
     """    
 
     import diffxpy.api as de
     
-    df_bdg = pd.read_csv(union_bedgraph, sep='\t')
+    df_bdg = pd.read_csv(union_bedgraph, sep='\t', dtype={'chrom': 'category'})
+
     df_viewpoints = pd.read_csv(capture_viewpoints, sep='\t', names=['chrom', 'start', 'end', 'name'])
 
     #  If design matrix present then use it. Else will assume that the standard format has been followed:
@@ -69,19 +121,22 @@ def differential(union_bedgraph: os.PathLike,
     
 
     # Only cis interactions
-    capture_chrom = get_chromosome_from_name(df_viewpoints, name=capture_name)
-    df_bdg_counts = df_bdg.query(f'chrom == "{capture_chrom}"')
+    viewpoint_chroms = dict(zip(df_viewpoints['name'].values, df_viewpoints['chrom'].values))
+    capture_chrom = viewpoint_chroms[capture_name]
+    df_bdg_counts = df_bdg.loc[df_bdg['chrom'] == capture_chrom]
 
     # Only counts
     df_bdg_counts = df_bdg_counts.iloc[:, 3:]
 
     # Only with number of interactions > threshold per group in at least 2 replicates
-    df_bdg_counts = (df_bdg_counts.groupby(df_design[grouping_col], axis=1)
-                                  .apply(lambda df: df[(df >= threshold_count).sum(axis=1) >= 2])
-                                  .fillna(0.0))
+    df_bdg_counts = filter_counts_by_threshold(df_bdg_counts,
+                                               groups=df_design[grouping_col],
+                                               threshold_count=threshold_count)
     
     # Run differential testing
-    count_data = df_bdg_counts.transpose().values.astype(np.float64)
+    # Transpose the NumPy array (N_SAMPLES * N_FRAGMENTS) rather than the DataFrame
+    # to avoid an additional copy.
+    count_data = df_bdg_counts.to_numpy(dtype=np.float64).T
     fragment_names = df_bdg_counts.index.values
 
     tests = de.test.pairwise(count_data, 
@@ -92,21 +147,22 @@ def differential(union_bedgraph: os.PathLike,
                              lazy=False, 
                              backend='numpy')
        
-    # Go through all of the pairwise tests
-    for g1, g2 in itertools.combinations(tests.groups, 2):
-        df_comparison = tests.summary_pairs(groups0=[g1,], 
-                                            groups1=[g2,],
-                                            qval_thres=threshold_q, 
-                                            mean_thres=threshold_mean)
-
-        # Extract the fragment coords
-        df_coords = df_bdg.loc[df_comparison['gene'], ['chrom', 'start', 'end']]
-        # Merge with test results
-        df_comparison = df_comparison.merge(df_coords, left_on='gene', right_index=True)
-        # Output to tsv
-        (df_comparison.drop(columns='gene')
-                      [['chrom', 'start', 'end', 'mean', 'log2fc', 'pval', 'qval']]
-                      .to_csv(f'{output_prefix}_{g1}_vs_{g2}.tsv', sep='\t', index=False))
+    # Fragment names are the row numbers of the union bedgraph so coordinates
+    # can be extracted by position rather than by label for each comparison.
+    df_coords_all = df_bdg[['chrom', 'start', 'end']]
+
+    # Go through all of the pairwise tests. The test results are summarised here as
+    # the tests object may not be picklable, only the output is written in parallel.
+    comparisons = {(g1, g2): tests.summary_pairs(groups0=[g1,], 
+                                                 groups1=[g2,],
+                                                 qval_thres=threshold_q, 
+                                                 mean_thres=threshold_mean)
+                   for g1, g2 in itertools.combinations(tests.groups, 2)}
+
+    Parallel(n_jobs=n_cores)(
+        delayed(write_comparison)(df_comparison, df_coords_all, f'{output_prefix}_{g1}_vs_{g2}.tsv')
+        for (g1, g2), df_comparison in comparisons.items()
+    )
 
 
 
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from capcruncher.cli.reporters_differential import (
+    filter_counts_by_threshold,
+    write_comparison,
+)
+
+
+@pytest.fixture
+def df_counts():
+    rng = np.random.default_rng(0)
+    samples = ["WT_1", "WT_2", "WT_3", "KO_1", "KO_2"]
+    return pd.DataFrame(
+        rng.integers(0, 40, size=(50, len(samples))),
+        columns=samples,
+        index=pd.RangeIndex(10, 60),
+    )
+
+
+@pytest.fixture
+def groups(df_counts):
+    return pd.Series(
+        {col: col.split("_")[0] for col in df_counts.columns}, name="condition"
+    )
+
+
+def test_filter_counts_by_threshold_matches_groupby(df_counts, groups):
+
+    threshold_count = 20
+
+    df_filtered = filter_counts_by_threshold(
+        df_counts, groups=groups, threshold_count=threshold_count
+    )
+
+    df_expected = (
+        df_counts.groupby(groups, axis=1)
+        .apply(lambda df: df[(df >= threshold_count).sum(axis=1) >= 2])
+        .fillna(0.0)
+    )
+
+    assert 0 < df_filtered.shape[0] < df_counts.shape[0]
+    assert set(df_filtered.index) == set(df_expected.index)
+    assert list(df_filtered.columns) == list(df_counts.columns)
+    pd.testing.assert_frame_equal(
+        df_filtered,
+        df_expected.loc[df_filtered.index, df_filtered.columns],
+        check_dtype=False,
+    )
+
+
+def test_write_comparison(tmp_path):
+
+    df_coords = pd.DataFrame(
+        {
+            "chrom": pd.Categorical(["chr1", "chr1", "chr2", "chr2"]),
+            "start": [0, 100, 200, 300],
+            "end": [100, 200, 300, 400],
+        }
+    )
+    df_comparison = pd.DataFrame(
+        {
+            "gene": ["2", "0", "3"],
+            "mean": [36.0, 10.5, np.nan],
+            "log2fc": [1.5, -0.5, 0.0],
+            "pval": [0.01, 0.2, np.nan],
+            "qval": [0.02, 0.3, 1.0],
+        }
+    )
+
+    output = tmp_path / "comparison.tsv"
+    write_comparison(df_comparison, df_coords, output)
+
+    df_output = pd.read_csv(output, sep="\t")
+    assert list(df_output.columns) == [
+        "chrom",
+        "start",
+        "end",
+        "mean",
+        "log2fc",
+        "pval",
+        "qval",
+    ]
+    assert df_output["chrom"].tolist() == ["chr2", "chr1", "chr2"]
+    assert df_output["start"].tolist() == [200, 0, 300]
+    assert df_output["end"].tolist() == [300, 100, 400]
+    pd.testing.assert_series_equal(df_output["mean"], df_comparison["mean"])
@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import subprocess
 import shutil
@@ -43,13 +44,13 @@ def setup():
                     'PATH_TO_CHROMOSOME_SIZES': data_path_chromsizes,
                     'HUB_DIR': dir_test_run}
             
+    # Single pass over each line irrespective of the number of replacements
+    pattern = re.compile('|'.join(re.escape(key) for key in replacements))
+
     with open(data_path_config, 'r') as config:
         with open('config.yml', 'w') as writer:
             for line in config:
-                for key in replacements:
-                    if key in line:
-                        line = line.replace(key, replacements[key])
-
+                line = pattern.sub(lambda match: replacements[match.group(0)], line)
                 writer.write(line)
     
     yield
@@ -62,41 +63,24 @@ def test_pipeline_handles_no_drmaa():
     completed = subprocess.run(cmd.split())
     assert completed.returncode == 0
 
-def test_pipeline_fastq_preprocessing():
-
-    cmd = f'python {dir_pipeline}/pipeline.py make fastq_preprocessing --local -p 4'
-    completed = subprocess.run(cmd.split())
-    assert completed.returncode == 0
-    assert len(glob.glob('capcruncher_preprocessing/digested/*.fastq.gz')) == 12
-
-def test_pipeline_pre_annotation():
-
-    cmd = f'python {dir_pipeline}/pipeline.py make pre_annotation --local -p 4'
-    completed = subprocess.run(cmd.split())
-    assert completed.returncode == 0
-
-def test_pipeline_post_annotation():
-
-    cmd = f'python {dir_pipeline}/pipeline.py make post_annotation --local -p 4'
+@pytest.fixture(scope="module")
+def pipeline_run():
+    # Run the full pipeline once, the intermediate stages are checked using their outputs
+    cmd = f'python {dir_pipeline}/pipeline.py make full --local -p 4'
     completed = subprocess.run(cmd.split())
-    assert completed.returncode == 0
+    return completed
 
-def test_pipeline_post_capcruncher_analysis():
+def test_pipeline_all(pipeline_run):
+    assert pipeline_run.returncode == 0
 
-    cmd = f'python {dir_pipeline}/pipeline.py make post_capcruncher_analysis --local -p 4'
-    completed = subprocess.run(cmd.split())
-    assert completed.returncode == 0
-
-def test_pipeline_all():
+def test_pipeline_fastq_preprocessing(pipeline_run):
+    assert len(glob.glob('capcruncher_preprocessing/digested/*.fastq.gz')) == 12
 
-    cmd = f'python {dir_pipeline}/pipeline.py make full --local -p 4'
-    completed = subprocess.run(cmd.split())
-    
-    assert completed.returncode == 0
+def test_pipeline_statistics(pipeline_run):
     assert os.path.exists('capcruncher_statistics/capcruncher_statistics.html')
-    assert len(glob.glob('capcruncher_analysis/bigwigs/Slc25A37*.bigWig')) == 16
-    assert os.path.exists('capturec_test.hub.txt')
-
-
 
+def test_pipeline_bigwigs(pipeline_run):
+    assert len(glob.glob('capcruncher_analysis/bigwigs/Slc25A37*.bigWig')) == 16
 
+def test_pipeline_hub(pipeline_run):
+    assert os.path.exists('capturec_test.hub.txt')
@@ -52,9 +52,81 @@ def test_from_yaml():
     sf.filter_slices()
     assert sf.slices.shape[0] == 2
 
+def test_remove_slice_level_filters():
 
+    sf_fused = CCSliceFilter(df_test_slices)
+    sf_fused.remove_slice_level_filters()
 
+    sf = CCSliceFilter(df_test_slices)
+    sf.remove_unmapped_slices()
+    sf.remove_excluded_slices()
+    sf.remove_blacklisted_slices()
+
+    assert sf_fused.slices["slice_name"].tolist() == sf.slices["slice_name"].tolist()
+
+
+def test_filter_slices_output_parquet(tmp_path):
+
+    pytest.importorskip("pyarrow")
+
+    sf = CCSliceFilter(df_test_slices)
+    sf.filter_slices(
+        output_slices="stage", output_location=tmp_path, output_format="parquet"
+    )
+
+    df_final_stage = pd.read_parquet(tmp_path / f"{list(sf.filter_stages)[-1]}.parquet")
+    assert df_final_stage.shape[0] == sf.slices.shape[0]
 
 
 
+def test_aggregate_sorted_slices_matches_groupby():
+
+    rng = np.random.default_rng(0)
+    n_slices = 200
+
+    df = pd.DataFrame(
+        {
+            "parent_read": pd.Categorical(
+                np.sort(rng.choice([f"R{i}" for i in range(40)], size=n_slices))
+            ),
+            "slice": rng.integers(0, 4, size=n_slices),
+            "mapped": rng.integers(0, 2, size=n_slices).astype(np.uint8),
+            "capture": rng.choice(["CapA", "CapB", ".", None], size=n_slices),
+            "pe": rng.choice(["flashed", "unflashed"], size=n_slices),
+            "coordinates": [f"chr1:{i}-{i + 100}" for i in range(n_slices)],
+        }
+    )
+
+    aggregations = dict(
+        unique_slices=("slice", "nunique"),
+        unique_capture_sites=("capture", "nunique"),
+        mapped=("mapped", "sum"),
+        pe=("pe", "first"),
+        coordinates=("coordinates", "join"),
+    )
+
+    df_expected = df.groupby(
+        "parent_read", as_index=False, sort=False, observed=True
+    ).agg(
+        **{
+            name: (col, "|".join if reducer == "join" else reducer)
+            for name, (col, reducer) in aggregations.items()
+        }
+    )
+
+    df_aggregated = CCSliceFilter._aggregate_sorted_slices(df, aggregations)
+    pd.testing.assert_frame_equal(df_aggregated, df_expected, check_dtype=False)
+
+    df_empty = CCSliceFilter._aggregate_sorted_slices(df.iloc[:0], aggregations)
+    assert df_empty.empty
+    assert list(df_empty.columns) == ["parent_read", *aggregations]
+
+
+def test_filter_slices_uses_updated_filter_stages():
+
+    sf = CCSliceFilter(df_test_slices)
+    sf.filter_stages = {"only": ["remove_unmapped_slices"]}
+    sf.filter_slices(verbose=False)
 
+    assert sf.filter_stats["stage"].tolist() == ["only"]
+    assert sf.slices.shape[0] == df_test_slices.shape[0] - 1
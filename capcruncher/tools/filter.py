@@ -2,6 +2,7 @@ import pandas as pd
 import os
 import numpy as np
 import itertools
+import weakref
 
 
 class SliceFilter:
@@ -78,7 +79,9 @@ class SliceFilter:
         """
 
         self._has_required_columns = self._required_columns_present(slices)
-        self.slices = slices.sort_values(["parent_read", "slice"])
+        self.slices = self._downcast_numeric_columns(
+            self._convert_to_categorical(slices.sort_values(["parent_read", "slice"]))
+        )
 
         if filter_stages:
             self.filter_stages = self._extract_filter_stages(filter_stages)
@@ -89,6 +92,82 @@ class SliceFilter:
         self.sample_name = sample_name
         self.read_type = read_type
 
+        # Cache of the aggregated fragments and a weak reference to the slices
+        # they were generated from.
+        self._fragments = None
+        self._fragments_source = None
+
+    @property
+    def slices(self) -> pd.DataFrame:
+        """
+        Annotated slices dataframe.
+
+        Slice level filters do not subset the slices immediately, instead
+        a boolean mask is accumulated and only applied when the slices are
+        next accessed.
+        """
+        self._compact()
+        return self._slices
+
+    @slices.setter
+    def slices(self, df: pd.DataFrame):
+        self._slices = df
+        self._active_mask = None
+        self._parent_codes = None
+        self._is_capture = None
+
+    def _compact(self):
+        """Applies any pending slice mask to the slices dataframe."""
+        if self._active_mask is not None:
+            self._slices = self._slices[self._active_mask]
+
+            if self._parent_codes is not None:
+                self._parent_codes = self._parent_codes[self._active_mask]
+
+            if self._is_capture is not None:
+                self._is_capture = self._is_capture[self._active_mask]
+
+            self._active_mask = None
+
+    def _mask_slices(self, mask: np.ndarray):
+        """
+        Marks slices for removal without subsetting the slices dataframe.
+
+        Args:
+         mask (np.ndarray): Boolean array (aligned to the uncompacted slices) of slices to keep.
+        """
+        if self._active_mask is None:
+            self._active_mask = mask
+        else:
+            self._active_mask = self._active_mask & mask
+
+    def _count_slices_and_reads(self) -> tuple:
+        """Counts the remaining slices and parental reads without applying any pending mask."""
+
+        mask = self._active_mask
+        parent_read = self._slices["parent_read"]
+
+        if mask is None or not isinstance(parent_read.dtype, pd.CategoricalDtype):
+            slices = self.slices
+            return slices.shape[0], slices["parent_read"].nunique()
+
+        codes = parent_read.cat.codes.to_numpy()[mask]
+        n_reads = np.count_nonzero(
+            np.bincount(codes[codes >= 0], minlength=len(parent_read.cat.categories))
+        )
+        return np.count_nonzero(mask), n_reads
+
+    def _capture_mask(self) -> np.ndarray:
+        """
+        Boolean mask of the (uncompacted) slices that overlap a capture site.
+
+        The mask is cached until the slices are reassigned.
+        """
+        if self._is_capture is None:
+            self._is_capture = (self._slices["capture"] != ".").to_numpy()
+
+        return self._is_capture
+
     def _required_columns_present(self, df) -> bool:
 
         columns_required = [
@@ -114,6 +193,105 @@ class SliceFilter:
 
         return True
 
+    def _convert_to_categorical(self, df) -> pd.DataFrame:
+        """
+        Converts repeated string columns to categorical.
+
+        Grouping, isin and equality comparisons then operate on the integer
+        category codes rather than on python strings. The "pe" column is not
+        converted as the aggregation of fragments uses groupby first(), which
+        is considerably slower for categorical columns.
+        """
+
+        columns_categorical = [
+            "parent_read",
+            "capture",
+            "chrom",
+            "restriction_fragment",
+            "exclusion",
+        ]
+
+        return df.astype(
+            {
+                col: "category"
+                for col in columns_categorical
+                if col in df.columns and df[col].dtype == object
+            }
+        )
+
+    def _downcast_numeric_columns(self, df) -> pd.DataFrame:
+        """
+        Stores flag/count columns and coordinates using the smallest practical dtype.
+
+        The 0/1 flags and small counts are downcast to unsigned integers (typically
+        uint8) and the start/end coordinates to int32 if they fit.
+        """
+
+        columns_flags = [
+            "mapped",
+            "multimapped",
+            "capture_count",
+            "exclusion_count",
+            "blacklist",
+        ]
+        columns_coordinates = ["start", "end"]
+        int32 = np.iinfo(np.int32)
+        columns_converted = dict()
+
+        for col in columns_flags:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                columns_converted[col] = pd.to_numeric(df[col], downcast="unsigned")
+
+        for col in columns_coordinates:
+            if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+                coords = df[col]
+                if coords.empty or (
+                    coords.min() >= int32.min and coords.max() <= int32.max
+                ):
+                    columns_converted[col] = coords.astype(np.int32)
+
+        return df.assign(**columns_converted)
+
+    def _keep_parent_reads_mask(self, parent_reads, invert: bool = False) -> np.ndarray:
+        """
+        Generates a mask of slices belonging to the supplied parental reads.
+
+        The parental read names are encoded against the categories of the slices
+        "parent_read" column and matched to the cached slice codes with np.in1d.
+        The mask is aligned to the uncompacted slices for use with _mask_slices.
+
+        Args:
+         parent_reads (pd.Series): Parental read names to keep.
+         invert (bool, optional): Keep slices not in parent_reads instead. Defaults to False.
+
+        Returns:
+         np.ndarray: Boolean mask of slices to keep.
+        """
+
+        slices_parent_read = self._slices["parent_read"]
+
+        if not isinstance(slices_parent_read.dtype, pd.CategoricalDtype):
+            return slices_parent_read.isin(parent_reads).to_numpy() ^ invert
+
+        codes = pd.Categorical(parent_reads, dtype=slices_parent_read.dtype).codes
+        return np.in1d(self._parent_read_codes(), codes, invert=invert)
+
+    def _parent_read_codes(self) -> np.ndarray:
+        """
+        Integer codes identifying the parental read of each (uncompacted) slice.
+
+        Codes are cached until the slices are reassigned.
+        """
+        if self._parent_codes is None:
+            parent_read = self._slices["parent_read"]
+
+            if isinstance(parent_read.dtype, pd.CategoricalDtype):
+                self._parent_codes = parent_read.cat.codes.to_numpy()
+            else:
+                self._parent_codes = pd.factorize(parent_read)[0]
+
+        return self._parent_codes
+
     def _extract_filter_stages(self, filter_stages) -> dict:
         """
         Extracts filter stages from a supplied dictionary or yaml file
@@ -215,15 +393,93 @@ class SliceFilter:
         """
         Summarises slices at the fragment level.
 
-        Uses pandas groupby to aggregate slices by their parental read name
-        (shared by all slices from the same fragment). Also determines the
-        number of reporter slices for each fragment.
+        Aggregates slices by their parental read name (shared by all slices
+        from the same fragment) using _aggregate_fragments. For Capture-C/Tri-C
+        this also determines the number of reporter slices for each fragment.
+
+        The aggregation is cached and only repeated if the slices dataframe has
+        been replaced (e.g. by a filter) since the fragments were last generated.
 
         Returns:
          pd.DataFrame: Slices aggregated by parental read name.
 
         """
-        raise NotImplementedError("Override this property")
+        if self._fragments_source is None or self._fragments_source() is not self.slices:
+            self._fragments = self._aggregate_fragments()
+            self._fragments_source = weakref.ref(self.slices)
+
+        return self._fragments
+
+    def _aggregate_fragments(self) -> pd.DataFrame:
+        """Aggregates slices by parental read name. Used to generate fragments."""
+        raise NotImplementedError("Override this method")
+
+    @staticmethod
+    def _aggregate_sorted_slices(df: pd.DataFrame, aggregations: dict) -> pd.DataFrame:
+        """
+        Aggregates slices by parental read name in a single pass over the columns.
+
+        Slices must already be sorted by "parent_read". Each group then occupies
+        a contiguous block of rows and all reductions are performed with numpy
+        on the group boundaries rather than dispatched per group by pandas.
+
+        Args:
+         df (pd.DataFrame): Slices sorted by parental read name.
+         aggregations (dict): Output column name mapped to a tuple of (column, reducer).
+                              Reducer must be one of "sum", "first", "nunique" or "join";
+                              "join" concatenates the values separated by "|".
+
+        Returns:
+         pd.DataFrame: Slices aggregated by parental read name.
+        """
+
+        group_codes, _ = pd.factorize(df["parent_read"])
+        n_slices = len(group_codes)
+        starts = np.flatnonzero(np.r_[True, group_codes[1:] != group_codes[:-1]])
+        n_groups = len(starts) if n_slices else 0
+
+        aggregated = {"parent_read": df["parent_read"].iloc[starts[:n_groups]].values}
+
+        for name, (column, reducer) in aggregations.items():
+
+            values = df[column].to_numpy()
+
+            if n_groups == 0:
+                aggregated[name] = (
+                    np.zeros(0, dtype=np.int64) if reducer == "nunique" else values[:0]
+                )
+
+            elif reducer == "sum":
+                # Accumulate in int64 as the flag columns are stored as small integers
+                dtype = np.int64 if values.dtype.kind in "biu" else None
+                aggregated[name] = np.add.reduceat(values, starts, dtype=dtype)
+
+            elif reducer == "first":
+                aggregated[name] = values[starts]
+
+            elif reducer == "nunique":
+                # Count distinct (group, value) pairs, missing values are ignored
+                value_codes, uniques = pd.factorize(df[column])
+                keys = np.sort(group_codes * (len(uniques) + 1) + (value_codes + 1))
+                is_distinct = np.r_[True, keys[1:] != keys[:-1]] & (
+                    keys % (len(uniques) + 1) != 0
+                )
+                aggregated[name] = np.bincount(
+                    keys[is_distinct] // (len(uniques) + 1), minlength=n_groups
+                )
+
+            elif reducer == "join":
+                # Join every value once, separating groups by a newline
+                separators = np.full(n_slices, "|", dtype=object)
+                separators[np.r_[starts[1:] - 1, n_slices - 1]] = "\n"
+                aggregated[name] = "".join(
+                    itertools.chain.from_iterable(zip(values, separators))
+                ).split("\n")[:-1]
+
+            else:
+                raise ValueError(f"Aggregation {reducer} not supported")
+
+        return pd.DataFrame(aggregated)
 
     @property
     def reporters(self) -> pd.DataFrame:
@@ -236,7 +492,13 @@ class SliceFilter:
         """
         raise NotImplementedError("Override this property")
 
-    def filter_slices(self, output_slices=False, output_location="."):
+    def filter_slices(
+        self,
+        output_slices=False,
+        output_location=".",
+        output_format="tsv",
+        verbose=True,
+    ):
         """
         Performs slice filtering.
 
@@ -248,24 +510,52 @@ class SliceFilter:
          output_slices (bool, optional): Determines if slices are to be output to a specified location after each filtering step.
                                          Useful for debugging. Defaults to False.
          output_location (str, optional): Location to output slices at each stage. Defaults to ".".
+         output_format (str, optional): Format of the output slices, either "tsv" (gzipped) or "parquet" (requires pyarrow).
+                                        Defaults to "tsv".
+         verbose (bool, optional): Print the number of slices and reads remaining after each filter. Defaults to True.
         """
 
-        for stage, filters in self.filter_stages.items():
-            for filt in filters:
+        # Filter methods are looked up once per call rather than for every filter
+        resolved_stages = [
+            (stage, [(filt, getattr(self, filt)) for filt in filters])
+            for stage, filters in self.filter_stages.items()
+        ]
+
+        for stage, filters in resolved_stages:
+            for filt, filter_method in filters:
                 # Call all of the filters in the filter_stages dict in order
-                print(f"Filtering: {filt}")
-                getattr(self, filt)()  # Gets and calls the selected method
-                print(f"Number of slices: {self.slices.shape[0]}")
-                print(f'Number of reads: {self.slices["parent_read"].nunique()}')
+                if verbose:
+                    print(f"Filtering: {filt}")
+
+                filter_method()
+
+                if verbose:
+                    n_slices, n_reads = self._count_slices_and_reads()
+                    print(f"Number of slices: {n_slices}")
+                    print(f"Number of reads: {n_reads}")
 
                 if output_slices == "filter":
-                    self.slices.to_csv(os.path.join(output_location, f"{filt}.tsv.gz"))
+                    self._write_slices(filt, output_location, output_format)
 
             if output_slices == "stage":
-                self.slices.to_csv(os.path.join(output_location, f"{stage}.tsv.gz"))
+                self._write_slices(stage, output_location, output_format)
 
             self._filter_stats[stage] = self.slice_stats
 
+    def _write_slices(self, name: str, output_location: str, output_format: str):
+        """Writes the current slices to output_location using the requested format."""
+
+        if output_format == "tsv":
+            self.slices.to_csv(os.path.join(output_location, f"{name}.tsv.gz"))
+        elif output_format == "parquet":
+            self.slices.to_parquet(
+                os.path.join(output_location, f"{name}.parquet"),
+                engine="pyarrow",
+                compression="zstd",
+            )
+        else:
+            raise ValueError(f"Output format {output_format} not supported")
+
     def get_unfiltered_slices(self):
         """
         Does not modify slices.
@@ -276,16 +566,20 @@ class SliceFilter:
         """
         Removes slices marked as unmapped (Uncommon)
         """
-        self.slices = self.slices.query("mapped == 1")
+        self._mask_slices(self._slices["mapped"].to_numpy() == 1)
 
     def remove_orphan_slices(self):
         """Remove fragments with only one aligned slice (Common)"""
 
-        fragments = self.fragments
-        fragments_multislice = fragments.query("unique_slices > 1")
-        self.slices = self.slices[
-            self.slices["parent_read"].isin(fragments_multislice["parent_read"])
-        ]
+        # Count unique slices per fragment without aggregating all fragment columns
+        n_unique_slices = (
+            self.slices.drop_duplicates(["parent_read", "slice"])
+            .groupby("parent_read", sort=False, observed=True)
+            .size()
+        )
+        self._mask_slices(
+            self._keep_parent_reads_mask(n_unique_slices.index[n_unique_slices > 1])
+        )
 
     def remove_duplicate_re_frags(self):
         """
@@ -302,7 +596,7 @@ class SliceFilter:
 
     def remove_slices_without_re_frag_assigned(self):
         """Removes slices if restriction_fragment column is N/A"""
-        self.slices = self.slices.query('restriction_fragment != "."')
+        self._mask_slices((self._slices["restriction_fragment"] != ".").to_numpy())
 
     def remove_duplicate_slices(self):
         """
@@ -323,14 +617,20 @@ class SliceFilter:
 
         """
 
-        frags_deduplicated = self.fragments.sample(frac=1).drop_duplicates(
-            subset="coordinates", keep="first"
-        )
+        fragments = self.fragments
 
-        self.slices = self.slices[
-            self.slices["parent_read"].isin(frags_deduplicated["parent_read"])
+        # Hash the fragment coordinates and keep the first occurrence of each hash.
+        # Only the fragment order is shuffled (as a randomised tiebreaker) rather
+        # than the entire fragments dataframe.
+        coordinate_hashes = pd.util.hash_array(fragments["coordinates"].to_numpy())
+        order = np.random.permutation(len(coordinate_hashes))
+        _, first_occurrence = np.unique(coordinate_hashes[order], return_index=True)
+        parent_reads_deduplicated = fragments["parent_read"].iloc[
+            order[first_occurrence]
         ]
 
+        self._mask_slices(self._keep_parent_reads_mask(parent_reads_deduplicated))
+
     def remove_duplicate_slices_pe(self):
         """
         Removes PCR duplicates from non-flashed (PE) fragments (Common).
@@ -341,19 +641,16 @@ class SliceFilter:
 
         """
         if (
-            self.slices["pe"].str.contains("unflashed").sum() > 1
+            np.count_nonzero(self.slices["pe"].to_numpy() == "unflashed") > 1
         ):  # at least one un-flashed
-            fragments = self.fragments.assign(
-                read_start=lambda df: df["coordinates"]
-                .str.split("|")
-                .str[0]
-                .str.split(r":|-")
-                .str[1],
-                read_end=lambda df: df["coordinates"]
-                .str.split("|")
-                .str[-1]
-                .str.split(r":|-")
-                .str[-1],
+            # Extract the start of the first slice and the end of the last slice
+            # from the fragment coordinates (e.g. chr1:1000-1250|chr1:1500-1750)
+            # in a single pass.
+            fragments = self.fragments
+            fragments = fragments.join(
+                fragments["coordinates"].str.extract(
+                    r"^(?:[^|:-]*[:-](?P<read_start>[^|:-]*))?.*?(?P<read_end>[^|:-]*)$"
+                )
             )
 
             fragments_pe = fragments.query('pe == "unflashed"')
@@ -361,21 +658,32 @@ class SliceFilter:
                 fragments_pe.duplicated(subset=["read_start", "read_end"])
             ]
 
-            self.slices = self.slices[
-                ~(
-                    self.slices["parent_read"].isin(
-                        fragments_pe_duplicated["parent_read"]
-                    )
+            self._mask_slices(
+                self._keep_parent_reads_mask(
+                    fragments_pe_duplicated["parent_read"], invert=True
                 )
-            ]  # Slices not in duplicated
+            )  # Slices not in duplicated
 
     def remove_excluded_slices(self):
         """Removes any slices in the exclusion region (default 1kb) (V. Common)"""
-        self.slices = self.slices.query("exclusion_count < 1")
+        self._mask_slices(self._slices["exclusion_count"].to_numpy() < 1)
 
     def remove_blacklisted_slices(self):
         """Removes slices marked as being within blacklisted regions"""
-        self.slices = self.slices.query("blacklist < 1")
+        self._mask_slices(self._slices["blacklist"].to_numpy() < 1)
+
+    def remove_slice_level_filters(self):
+        """
+        Removes unmapped, excluded and blacklisted slices in a single pass.
+
+        Equivalent to remove_unmapped_slices, remove_excluded_slices and
+        remove_blacklisted_slices but the slice columns are only scanned once.
+        """
+        self._mask_slices(
+            (self._slices["mapped"].to_numpy() == 1)
+            & (self._slices["exclusion_count"].to_numpy() < 1)
+            & (self._slices["blacklist"].to_numpy() < 1)
+        )
 
 
 class CCSliceFilter(SliceFilter):
@@ -389,8 +697,7 @@ class CCSliceFilter(SliceFilter):
      - remove_unmapped_slices
      - remove_orphan_slices
      - remove_multi_capture_fragments
-     - remove_excluded_slices
-     - remove_blacklisted_slices
+     - remove_slice_level_filters
      - remove_non_reporter_fragments
      - remove_multicapture_reporters
      - remove_slices_without_re_frag_assigned
@@ -426,8 +733,7 @@ class CCSliceFilter(SliceFilter):
                     "remove_multi_capture_fragments",
                 ],
                 "contains_capture_and_reporter": [
-                    "remove_excluded_slices",
-                    "remove_blacklisted_slices",
+                    "remove_slice_level_filters",
                     "remove_non_reporter_fragments",
                     "remove_multicapture_reporters",
                 ],
@@ -442,24 +748,41 @@ class CCSliceFilter(SliceFilter):
 
         super(CCSliceFilter, self).__init__(slices, filter_stages, **sample_kwargs)
 
-    @property
-    def fragments(self) -> pd.DataFrame:
+    def _aggregate_fragments(self) -> pd.DataFrame:
         """
         Summarises slices at the fragment level.
 
-        Uses pandas groupby to aggregate slices by their parental read name
-        (shared by all slices from the same fragment). Also determines the
-        number of reporter slices for each fragment.
+        Slices are sorted by their parental read name (shared by all slices
+        from the same fragment) and aggregated in a single pass over the
+        columns with _aggregate_sorted_slices. Also determines the number of
+        reporter slices for each fragment.
 
         Returns:
          pd.DataFrame: Slices aggregated by parental read name.
 
         """
 
-        df = (
-            self.slices.sort_values(["parent_read", "chrom", "start"])
-            .groupby("parent_read", as_index=False, sort=False)
-            .agg(
+        # Only the columns required for aggregation are sorted and grouped
+        columns = [
+            "parent_read",
+            "chrom",
+            "start",
+            "slice",
+            "pe",
+            "mapped",
+            "multimapped",
+            "capture",
+            "capture_count",
+            "exclusion",
+            "exclusion_count",
+            "restriction_fragment",
+            "blacklist",
+            "coordinates",
+        ]
+
+        df = self._aggregate_sorted_slices(
+            self.slices[columns].sort_values(["parent_read", "chrom", "start"]),
+            aggregations=dict(
                 unique_slices=("slice", "nunique"),
                 pe=("pe", "first"),
                 mapped=("mapped", "sum"),
@@ -470,8 +793,8 @@ class CCSliceFilter(SliceFilter):
                 exclusion_count=("exclusion_count", "sum"),
                 unique_restriction_fragments=("restriction_fragment", "nunique"),
                 blacklist=("blacklist", "sum"),
-                coordinates=("coordinates", "|".join),
-            )
+                coordinates=("coordinates", "join"),
+            ),
         )
 
         df["unique_capture_sites"] = df["unique_capture_sites"] - 1  # nunique identifies '.' as a capture site
@@ -491,35 +814,35 @@ class CCSliceFilter(SliceFilter):
 
     @property
     def slice_stats(self):
-        slices = self.slices.copy()
+        aggregations = {
+            "slice_name": "nunique",
+            "parent_read": "nunique",
+            "mapped": "sum",
+            "multimapped": "sum",
+            "capture": "nunique",
+            "capture_count": lambda col: (col > 0).sum(),
+            "exclusion_count": lambda col: (col > 0).sum(),
+            "blacklist": "sum",
+        }
+
+        stat_names = {
+            "slice_name": "unique_slices",
+            "parent_read": "unique_fragments",
+            "multimapped": "multimapping_slices",
+            "capture": "unique_capture_sites",
+            "capture_count": "number_of_capture_slices",
+            "exclusion_count": "number_of_slices_in_exclusion_region",
+            "blacklist": "number_of_slices_in_blacklisted_region",
+        }
+
+        slices = self.slices
         if slices.empty:  # Deal with empty dataframe i.e. no valid slices
-            for col in slices:
-                slices[col] = np.zeros((10,))
-
-        stats_df = slices.agg(
-            {
-                "slice_name": "nunique",
-                "parent_read": "nunique",
-                "mapped": "sum",
-                "multimapped": "sum",
-                "capture": "nunique",
-                "capture_count": lambda col: (col > 0).sum(),
-                "exclusion_count": lambda col: (col > 0).sum(),
-                "blacklist": "sum",
-            }
-        )
+            return pd.Series(
+                0, index=[stat_names.get(col, col) for col in aggregations]
+            )
 
-        stats_df = stats_df.rename(
-            {
-                "slice_name": "unique_slices",
-                "parent_read": "unique_fragments",
-                "multimapped": "multimapping_slices",
-                "capture": "unique_capture_sites",
-                "capture_count": "number_of_capture_slices",
-                "exclusion_count": "number_of_slices_in_exclusion_region",
-                "blacklist": "number_of_slices_in_blacklisted_region",
-            }
-        )
+        stats_df = slices.agg(aggregations)
+        stats_df = stats_df.rename(stat_names)
 
         return stats_df
 
@@ -560,7 +883,8 @@ class CCSliceFilter(SliceFilter):
 
     @property
     def reporters(self) -> pd.DataFrame:
-        return self.slices.query('capture == "."')
+        slices = self.slices
+        return slices[~self._capture_mask()]
 
     @property
     def captures(self) -> pd.DataFrame:
@@ -573,12 +897,26 @@ class CCSliceFilter(SliceFilter):
          pd.DataFrame: Capture slices
 
         """
-        return self.slices.query('~(capture == ".")')
+        slices = self.slices
+        return slices[self._capture_mask()]
 
     @property
     def capture_site_stats(self) -> pd.Series:
         """Extracts the number of unique capture sites."""
-        return self.captures["capture"].value_counts()
+
+        captures = self.captures["capture"]
+
+        if not isinstance(captures.dtype, pd.CategoricalDtype):
+            return captures.value_counts()
+
+        # Count the category codes directly, ordered by count as for value_counts
+        codes = captures.cat.codes.to_numpy()
+        counts = pd.Series(
+            np.bincount(codes[codes >= 0], minlength=len(captures.cat.categories)),
+            index=captures.cat.categories,
+            name="capture",
+        )
+        return counts.loc[counts > 0].sort_values(ascending=False, kind="stable")
 
     @property
     def merged_captures_and_reporters(self) -> pd.DataFrame:
@@ -593,20 +931,23 @@ class CCSliceFilter(SliceFilter):
          pd.DataFrame: Merged capture and reporter slices
         """
 
-        captures = (
-            self.captures.set_index("parent_read")
-            .add_prefix("capture_")
-            .rename(columns={"capture_capture": "capture"})
+        captures = self.captures.add_prefix("capture_").rename(
+            columns={"capture_capture": "capture", "capture_parent_read": "parent_read"}
         )
 
-        reporters = self.reporters.set_index("parent_read").add_prefix("reporter_")
+        reporters = self.reporters.add_prefix("reporter_").rename(
+            columns={"reporter_parent_read": "parent_read"}
+        )
 
-        # Join reporters to captures using the parent read name
-        captures_and_reporters = (
-            captures.join(reporters).dropna(axis=0, how="any").reset_index()
+        # Inner merge of reporters to captures using the parent read name
+        captures_and_reporters = captures.merge(
+            reporters, on="parent_read", how="inner"
         )
 
-        return captures_and_reporters
+        # Parent read name first as for the previous index based join
+        return captures_and_reporters[
+            ["parent_read", *captures_and_reporters.columns.drop("parent_read")]
+        ]
 
     @property
     def cis_or_trans_stats(self) -> pd.DataFrame:
@@ -627,11 +968,18 @@ class CCSliceFilter(SliceFilter):
         try:
             # Aggregate by capture site for reporting
             interactions_by_capture = pd.DataFrame(
-                cap_and_rep.groupby("capture")["cis/trans"]
+                cap_and_rep.groupby("capture", observed=True)["cis/trans"]
                 .value_counts()
                 .to_frame()
                 .rename(columns={"cis/trans": "count"})
                 .reset_index()
+                # Categorical groups are returned in order of appearance, restore capture order
+                .sort_values(
+                    "capture",
+                    key=lambda col: col.astype(str),
+                    kind="stable",
+                    ignore_index=True,
+                )
                 .assign(sample=self.sample_name, read_type=self.read_type)
             )
         except Exception as e:
@@ -646,10 +994,24 @@ class CCSliceFilter(SliceFilter):
 
         """
 
-        frags_reporter = self.fragments.query("reporter_count > 0")
-        self.slices = self.slices[
-            self.slices["parent_read"].isin(frags_reporter["parent_read"])
-        ]
+        # Sums the per-slice columns used for fragments["reporter_count"] directly
+        # rather than aggregating all of the fragment columns.
+        slices = self.slices
+        codes = self._parent_read_codes()
+        n_fragments = codes.max(initial=-1) + 1
+
+        totals = {
+            col: np.bincount(
+                codes, weights=slices[col].to_numpy(), minlength=n_fragments
+            )
+            for col in ["mapped", "capture_count", "exclusion_count", "blacklist"]
+        }
+        reporter_count = totals["mapped"] - (
+            totals["exclusion_count"] + totals["capture_count"] + totals["blacklist"]
+        )
+        has_reporter = (totals["capture_count"] > 0) & (reporter_count > 0)
+
+        self._mask_slices(has_reporter[codes])
 
     def remove_multi_capture_fragments(self):
         """
@@ -659,10 +1021,15 @@ class CCSliceFilter(SliceFilter):
         one capture probe is present i.e. a double capture (V. Common)
 
         """
-        frags_capture = self.fragments.query("0 < unique_capture_sites < 2")
-        self.slices = self.slices[
-            self.slices["parent_read"].isin(frags_capture["parent_read"])
-        ]
+        # Equivalent to 0 < fragments["unique_capture_sites"] < 2. As for
+        # unique_capture_sites, "." is counted as a capture site.
+        n_unique_captures = (
+            self.slices.drop_duplicates(["parent_read", "capture"])
+            .groupby("parent_read", sort=False, observed=True)
+            .size()
+        )
+        frags_capture = n_unique_captures.index[n_unique_captures == 2]
+        self._mask_slices(self._keep_parent_reads_mask(frags_capture))
 
     def remove_multicapture_reporters(self, n_adjacent: int = 1):
         """
@@ -685,18 +1052,17 @@ class CCSliceFilter(SliceFilter):
         captures = self.captures
         re_frags = captures["restriction_fragment"].unique()
 
-        # Generates a list of restriction fragments to be excluded from further analysis
-        excluded_fragments = [
-            frag + modifier
-            for frag in re_frags
-            for modifier in range(-n_adjacent, n_adjacent + 1)
-        ]
+        # Generates an array of restriction fragments to be excluded from further analysis
+        excluded_fragments = np.add.outer(
+            re_frags, np.arange(-n_adjacent, n_adjacent + 1)
+        ).ravel()
 
         # Remove non-capture slices (reporters) in excluded regions
-        self.slices = self.slices[
-            (self.slices["capture_count"] > 0)
-            | (~self.slices["restriction_fragment"].isin(excluded_fragments))
-        ]
+        slices = self.slices
+        self._mask_slices(
+            (slices["capture_count"].to_numpy() > 0)
+            | ~np.in1d(slices["restriction_fragment"].to_numpy(), excluded_fragments)
+        )
 
 
 class TriCSliceFilter(CCSliceFilter):
@@ -766,9 +1132,9 @@ class TriCSliceFilter(CCSliceFilter):
     def remove_slices_with_one_reporter(self):
         """Removes fragments if they do not contain at least two reporters."""
         fragments_triplets = self.fragments.query("reporter_count > 1")
-        self.slices = self.slices.loc[
-            lambda df: df["parent_read"].isin(fragments_triplets["parent_read"])
-        ]
+        self._mask_slices(
+            self._keep_parent_reads_mask(fragments_triplets["parent_read"])
+        )
 
 
 class TiledCSliceFilter(SliceFilter):
@@ -831,34 +1197,26 @@ class TiledCSliceFilter(SliceFilter):
 
         super(TiledCSliceFilter, self).__init__(slices, filter_stages, **sample_kwargs)
 
-    @property
-    def fragments(self) -> pd.DataFrame:
-        df = (
-            self.slices.sort_values(["parent_read", "chrom", "start"])
-            .groupby("parent_read", as_index=False, sort=False)
-            .agg(
-                {
-                    "slice": "nunique",
-                    "pe": "first",
-                    "mapped": "sum",
-                    "multimapped": "sum",
-                    "capture_count": "sum",
-                    "restriction_fragment": "nunique",
-                    "blacklist": "sum",
-                    "coordinates": "|".join,
-                }
-            )
+    def _aggregate_fragments(self) -> pd.DataFrame:
+        aggregations = dict(
+            unique_slices=("slice", "nunique"),
+            pe=("pe", "first"),
+            mapped=("mapped", "sum"),
+            multimapped=("multimapped", "sum"),
+            capture_count=("capture_count", "sum"),
+            unique_restriction_fragments=("restriction_fragment", "nunique"),
+            blacklisted_slices=("blacklist", "sum"),
+            coordinates=("coordinates", "join"),
         )
-
-        # Rename for clarity
-        df = df.rename(
-            columns={
-                "restriction_fragment": "unique_restriction_fragments",
-                "slice": "unique_slices",
-                "blacklist": "blacklisted_slices",
-            }
+        columns = [column for column, _ in aggregations.values()]
+
+        # Only the columns required for aggregation are sorted and grouped
+        return self._aggregate_sorted_slices(
+            self.slices[["parent_read", "chrom", "start", *columns]].sort_values(
+                ["parent_read", "chrom", "start"]
+            ),
+            aggregations=aggregations,
         )
-        return df
 
     @property
     def slice_stats(self):
@@ -900,41 +1258,52 @@ class TiledCSliceFilter(SliceFilter):
          pd.DataFrame: Reporter cis/trans statistics
         """
 
-        interactions_by_capture = dict()
-
-        for capture_site, df_cap in self.slices.query('capture != "."').groupby(
-            "capture"
-        ):
+        slices = self.slices
+        is_capture = self._capture_mask()
+        df_cap = slices.loc[is_capture, ["parent_read", "capture", "chrom"]]
+        df_rep = slices.loc[~is_capture, ["parent_read", "chrom"]]
+
+        # The chromosome of each capture site is taken from its first slice
+        capture_chroms = (
+            df_cap.drop_duplicates("capture")
+            .assign(capture=lambda df: df["capture"].astype(str))
+            .set_index("capture")["chrom"]
+            .sort_index()
+        )
 
-            capture_chrom = df_cap.iloc[0]["chrom"]
-            df_primary_capture = df_cap.groupby(
-                "parent_read"
-            ).first()  # Artifact required as need to call one slice the "capture"
-            df_not_primary_capture = df_cap.loc[
-                ~(df_cap["slice_name"].isin(df_primary_capture["slice_name"]))
-            ]
-            df_outside_capture = self.slices.query('capture == "."').loc[
-                lambda df_rep: df_rep["parent_read"].isin(df_cap["parent_read"])
-            ]
+        # Artifact required as need to call one slice per fragment the "capture"
+        is_primary_capture = ~df_cap.duplicated(["parent_read", "capture"]).to_numpy()
+        df_not_primary_capture = df_cap.loc[~is_primary_capture, ["capture", "chrom"]]
+        df_outside_capture = df_rep.merge(
+            df_cap.loc[is_primary_capture, ["parent_read", "capture"]], on="parent_read"
+        )[["capture", "chrom"]]
+
+        df_pseudo_reporters = pd.concat(
+            [df_not_primary_capture, df_outside_capture]
+        ).astype(str)
+        is_cis = (
+            df_pseudo_reporters["chrom"].to_numpy()
+            == df_pseudo_reporters["capture"].map(capture_chroms.astype(str)).to_numpy()
+        )
 
-            df_pseudo_reporters = pd.concat(
-                [df_not_primary_capture, df_outside_capture]
-            )
-            n_cis_interactions = df_pseudo_reporters.query(
-                f'chrom == "{capture_chrom}"'
-            ).shape[0]
-            n_trans_interactions = df_pseudo_reporters.shape[0] - n_cis_interactions
+        n_interactions = df_pseudo_reporters.groupby("capture").size()
+        n_cis_interactions = (
+            pd.Series(is_cis, index=df_pseudo_reporters.index)
+            .groupby(df_pseudo_reporters["capture"])
+            .sum()
+        )
 
-            interactions_by_capture[capture_site] = {
+        interactions_by_capture = pd.DataFrame(
+            {
                 "cis": n_cis_interactions,
-                "trans": n_trans_interactions,
-            }
+                "trans": n_interactions - n_cis_interactions,
+            },
+            index=capture_chroms.index,
+        ).fillna(0).astype(int)
 
         return (
-            pd.DataFrame(interactions_by_capture)
-            .transpose()
+            interactions_by_capture.rename_axis("capture")
             .reset_index()
-            .rename(columns={"index": "capture"})
             .melt(id_vars="capture", var_name="cis/trans", value_name="count")
             .sort_values("capture")
             .assign(sample=self.sample_name, read_type=self.read_type)
@@ -942,14 +1311,14 @@ class TiledCSliceFilter(SliceFilter):
 
     def remove_slices_outside_capture(self):
         """Removes slices outside of capture region(s)"""
-        self.slices = self.slices.query('capture != "."')
+        self._mask_slices(self._capture_mask())
 
     def remove_non_capture_fragments(self):
         """Removes fragments without a capture assigned"""
         fragments_with_capture = self.fragments.query("capture_count > 0")
-        self.slices = self.slices[
-            self.slices["parent_read"].isin(fragments_with_capture["parent_read"])
-        ]
+        self._mask_slices(
+            self._keep_parent_reads_mask(fragments_with_capture["parent_read"])
+        )
 
     def remove_dual_capture_fragments(self):
         """
@@ -958,9 +1327,10 @@ class TiledCSliceFilter(SliceFilter):
         Modified for TiledC filtering as the fragment dataframe is generated
         slightly differently.
         """
+        slices = self.slices
         multicapture_fragments = (
-            self.slices.query('capture != "."')
-            .groupby("parent_read")["capture"]
+            slices[self._capture_mask()]
+            .groupby("parent_read", observed=True)["capture"]
             .nunique()
             > 1
         )